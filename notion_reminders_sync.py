@@ -19,7 +19,11 @@ Configuration:
     See config.example.json for the required fields.
 
 Requirements:
-    pip install pyobjc-framework-EventKit pyobjc-framework-Foundation requests
+    pip install pyobjc-framework-EventKit pyobjc-framework-Foundation \
+        pyobjc-framework-libdispatch "httpx[http2]"
+
+    Optional, for faster JSON and timestamp parsing:
+    pip install orjson ciso8601
 
 Usage:
     python notion_reminders_sync.py [--dry-run]
@@ -31,20 +35,39 @@ import os
 import re
 import sys
 import time
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
+from urllib.parse import unquote
+
+import httpx
+
+# Optional fast JSON codec for API responses and the sync state
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-import requests
+json_loads = orjson.loads if orjson else json.loads
+
+# Optional C parser for ISO 8601 timestamps
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    def parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 # EventKit imports - these require macOS
 try:
     import EventKit
     import Foundation
+    import libdispatch
 except ImportError:
     print("Error: PyObjC frameworks not found. Install with:")
-    print("  pip install pyobjc-framework-EventKit pyobjc-framework-Foundation")
+    print("  pip install pyobjc-framework-EventKit pyobjc-framework-Foundation "
+          "pyobjc-framework-libdispatch")
     sys.exit(1)
 
 
@@ -163,28 +186,65 @@ TYPE_EXCLUDE = CONFIG["TYPE_EXCLUDE"]
 # State file for tracking synced items (to detect deletions)
 STATE_FILE = Path(__file__).parent.resolve() / ".sync_state.json"
 
+# Between full scans, only Notion pages edited since the last sync are fetched.
+# A full scan every N runs catches pages that were deleted (which never show
+# up as edited).
+NOTION_FULL_SCAN_INTERVAL = 12
+
+# Notion URLs: https://www.notion.so/workspace/Page-Title-abc123def456
+# or https://www.notion.so/abc123def456
+_NOTION_URL_RE = re.compile(r'notion\.so/(?:[^/]+/)?(?:[^-]+-)?([a-f0-9]{32})')
+_NOTION_BARE_ID_RE = re.compile(r'([a-f0-9]{32})')
+
 
 def load_sync_state() -> dict:
     """Load the previous sync state from disk."""
     if STATE_FILE.exists():
         try:
-            with open(STATE_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            with open(STATE_FILE, "rb") as f:
+                return json_loads(f.read())
+        except (json.JSONDecodeError, IOError):  # orjson's error subclasses json's
             pass
-    return {"synced_pairs": {}}  # notion_page_id -> reminder_id
+    return {"synced_pairs": {}}  # notion_page_id -> pair (see pair_reminder_id)
+
+
+def pair_reminder_id(pair) -> str:
+    """
+    Get the reminder ID of a synced_pairs entry.
+
+    Entries are dicts holding the reminder ID, plus the modification times
+    of both sides and the customer name when they were last in sync; older
+    state files store just the reminder ID.
+    """
+    return pair if isinstance(pair, str) else pair["reminder_id"]
 
 
 def save_sync_state(state: dict):
-    """Save the current sync state to disk."""
+    """
+    Save the current sync state to disk.
+
+    The file is written compactly; set NOTION_SYNC_DEBUG to pretty-print it.
+    It is written to a temporary file first and then moved into place, so an
+    interrupted save never leaves a truncated state file behind.
+    """
+    pretty = bool(os.environ.get("NOTION_SYNC_DEBUG"))
+    temp_file = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
     try:
-        with open(STATE_FILE, "w") as f:
-            json.dump(state, f, indent=2)
+        if orjson:
+            with open(temp_file, "wb") as f:
+                f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2 if pretty else None))
+        else:
+            with open(temp_file, "w") as f:
+                if pretty:
+                    json.dump(state, f, indent=2)
+                else:
+                    json.dump(state, f, separators=(",", ":"))
+        os.replace(temp_file, STATE_FILE)
     except IOError as e:
         print(f"Warning: Failed to save sync state: {e}")
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionTask:
     """Represents a task from Notion."""
     page_id: str
@@ -194,13 +254,49 @@ class NotionTask:
     last_updated: datetime
     customer_name: Optional[str]
     url: str
+    customer_id: Optional[str] = None
+    # Integer copies of last_updated and the due day for cheap comparisons
+    last_updated_ns: int = field(default=0, init=False, repr=False, compare=False)
+    due_ordinal: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    # Whether the status is Done or Canceled
+    is_done: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.last_updated_ns = int(self.last_updated.timestamp() * 1e9)
+        if self.due_date:
+            self.due_ordinal = self.due_date.toordinal()
+        self.is_done = self.status in (STATUS_DONE, STATUS_CANCELED)
+
+    def to_dict(self) -> dict:
+        """Serialize for the sync state file."""
+        return {
+            "page_id": self.page_id,
+            "title": self.title,
+            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "status": self.status,
+            "last_updated": self.last_updated.isoformat(),
+            "customer_name": self.customer_name,
+            "url": self.url,
+            "customer_id": self.customer_id,
+        }
 
-    @property
-    def is_done(self) -> bool:
-        return self.status in (STATUS_DONE, STATUS_CANCELED)
+    @classmethod
+    def from_dict(cls, data: dict) -> "NotionTask":
+        """Deserialize from the sync state file."""
+        due_date = data.get("due_date")
+        return cls(
+            page_id=data["page_id"],
+            title=data["title"],
+            due_date=parse_iso_datetime(due_date) if due_date else None,
+            status=data["status"],
+            last_updated=parse_iso_datetime(data["last_updated"]),
+            customer_name=data.get("customer_name"),
+            url=data["url"],
+            customer_id=data.get("customer_id"),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Reminder:
     """Represents an Apple Reminder."""
     id: str
@@ -212,20 +308,30 @@ class Reminder:
     last_modified: Optional[datetime]
     tags: list[str]  # List of tag names
     ek_reminder: object  # The underlying EKReminder object
-
-    @property
-    def notion_page_id(self) -> Optional[str]:
-        """Extract Notion page ID from the URL field."""
-        if not self.url:
-            return None
-        # Notion URLs: https://www.notion.so/workspace/Page-Title-abc123def456
-        # or https://www.notion.so/abc123def456
-        match = re.search(r'notion\.so/(?:[^/]+/)?(?:[^-]+-)?([a-f0-9]{32})', self.url)
-        if match:
-            return match.group(1)
-        # Also try extracting raw ID from URL
-        match = re.search(r'([a-f0-9]{32})', self.url)
-        return match.group(1) if match else None
+    # Notion page ID extracted from the URL field
+    notion_page_id: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Integer copies of last_modified and the due day for cheap comparisons
+    last_modified_ns: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    due_ordinal: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.last_modified:
+            self.last_modified_ns = int(self.last_modified.timestamp() * 1e9)
+        if self.due_date:
+            self.due_ordinal = self.due_date.toordinal()
+
+        # Extract the Notion page ID once; it's read many times per sync
+        if self.url:
+            match = _NOTION_URL_RE.search(self.url)
+            if not match:
+                # Also try extracting raw ID from URL
+                match = _NOTION_BARE_ID_RE.search(self.url)
+            if match:
+                self.notion_page_id = match.group(1)
 
     @property
     def has_notion_url(self) -> bool:
@@ -240,21 +346,59 @@ class NotionClient:
 
     BASE_URL = "https://api.notion.com/v1"
 
-    def __init__(self, api_key: str):
+    # Requests in flight at once. Notion allows an average of 3 requests per
+    # second per integration and answers bursts above that with 429, which
+    # _request retries after the Retry-After delay.
+    MAX_CONCURRENT_REQUESTS = 3
+    MAX_RATE_LIMIT_RETRIES = 5
+
+    def __init__(
+        self,
+        api_key: str,
+        customer_cache: Optional[dict[str, str]] = None,
+        schema_cache: Optional[dict] = None,
+    ):
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {api_key}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json",
-        })
-        # Cache for customer names
-        self._customer_cache: dict[str, str] = {}
+        # HTTP/2 lets concurrent requests share one connection
+        self.session = httpx.Client(
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Notion-Version": "2022-06-28",
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,
+        )
+        # Worker threads for concurrent requests, shared by every batch call
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_CONCURRENT_REQUESTS,
+            thread_name_prefix="notion",
+        )
+        # Cache for customer names (page ID -> name). Callers may pass in a
+        # dict they persist between runs.
+        self._customer_cache: dict[str, str] = (
+            customer_cache if customer_cache is not None else {}
+        )
+        # Cache for the property IDs used to trim query responses
+        self._schema_cache: dict = schema_cache if schema_cache is not None else {}
+        # Property updates waiting for flush_updates(): page_id -> properties
+        self._pending_updates: dict[str, dict] = {}
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, waiting out Notion's rate limit when it answers 429."""
+        for _ in range(self.MAX_RATE_LIMIT_RETRIES):
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                break
+            try:
+                delay = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                delay = 1.0
+            time.sleep(delay)
+        return response
 
     def query_my_tasks(self, database_id: str, user_id: str) -> list[NotionTask]:
         """Query tasks assigned to user, not Done, optionally excluding a Type."""
-        url = f"{self.BASE_URL}/databases/{database_id}/query"
-
         filter_conditions = [
             {
                 "property": PROP_ASSIGNEE,
@@ -285,9 +429,70 @@ class NotionClient:
                 }
             })
 
-        filter_payload = {"and": filter_conditions}
+        tasks = []
+        pages = self._query_database(
+            database_id, {"and": filter_conditions}, self._task_property_ids(database_id)
+        )
+        for page in pages:
+            task = self._parse_page(page)
+            if task:
+                tasks.append(task)
+
+        self._resolve_customer_names(tasks)
+        return tasks
+
+    def query_changed_tasks(
+        self,
+        database_id: str,
+        user_id: str,
+        edited_since: datetime,
+    ) -> tuple[list[NotionTask], list[str]]:
+        """
+        Query pages edited since a point in time.
+
+        The filters from query_my_tasks are applied locally rather than in the
+        query, so pages that stopped matching (marked Done, reassigned, ...)
+        are reported too. Returns (tasks that match, IDs of pages that don't).
+        """
+        filter_payload = {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {
+                "on_or_after": edited_since.isoformat()
+            }
+        }
 
         tasks = []
+        dropped_ids = []
+        compact_user_id = user_id.replace("-", "")
+        pages = self._query_database(
+            database_id, filter_payload, self._task_property_ids(database_id)
+        )
+        for page in pages:
+            matches = self._matches_my_tasks(page, compact_user_id)
+            task = self._parse_page(page) if matches else None
+            if task:
+                tasks.append(task)
+            else:
+                dropped_ids.append(page["id"].replace("-", ""))
+
+        self._resolve_customer_names(tasks)
+        return tasks, dropped_ids
+
+    def _query_database(
+        self,
+        database_id: str,
+        filter_payload: dict,
+        property_ids: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Fetch all pages in a database matching a filter.
+
+        If property_ids is given, only those properties are returned per page.
+        """
+        url = f"{self.BASE_URL}/databases/{database_id}/query"
+        params = [("filter_properties", prop_id) for prop_id in property_ids or []]
+
+        pages = []
         has_more = True
         start_cursor = None
 
@@ -296,19 +501,67 @@ class NotionClient:
             if start_cursor:
                 payload["start_cursor"] = start_cursor
 
-            response = self.session.post(url, json=payload)
+            response = self._request("POST", url, params=params, json=payload)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
-            for page in data.get("results", []):
-                task = self._parse_page(page)
-                if task:
-                    tasks.append(task)
+            pages.extend(data.get("results", []))
 
             has_more = data.get("has_more", False)
             start_cursor = data.get("next_cursor")
 
-        return tasks
+        return pages
+
+    def _task_property_ids(self, database_id: str) -> list[str]:
+        """
+        Get the IDs of the properties the sync reads, from the database schema.
+
+        Returns an empty list (meaning all properties) if the schema can't be
+        fetched.
+        """
+        names = [
+            PROP_TITLE, PROP_ASSIGNEE, PROP_STATUS, PROP_DUE_DATE,
+            PROP_CUSTOMER, PROP_TYPE, "Last updated",
+        ]
+        cache = self._schema_cache
+        if cache.get("database_id") == database_id and cache.get("names") == names:
+            return cache["ids"]
+
+        try:
+            response = self._request("GET", f"{self.BASE_URL}/databases/{database_id}")
+            response.raise_for_status()
+            properties = json_loads(response.content).get("properties", {})
+        except Exception as e:
+            print(f"Warning: Failed to fetch database schema: {e}")
+            return []
+
+        # IDs come back URL-encoded; decode them so they're encoded only once
+        ids = [unquote(properties[name]["id"]) for name in names if name in properties]
+        cache.clear()
+        cache.update({"database_id": database_id, "names": names, "ids": ids})
+        return ids
+
+    def _matches_my_tasks(self, page: dict, compact_user_id: str) -> bool:
+        """Check a page against the query_my_tasks filter (user ID without hyphens)."""
+        if page.get("archived", False) or page.get("in_trash", False):
+            return False
+
+        properties = page.get("properties", {})
+
+        people = properties.get(PROP_ASSIGNEE, {}).get("people", [])
+        if not any(p["id"].replace("-", "") == compact_user_id for p in people):
+            return False
+
+        status = (properties.get(PROP_STATUS, {}).get("status") or {}).get("name")
+        if status in (STATUS_DONE, STATUS_CANCELED):
+            return False
+
+        if TYPE_EXCLUDE:
+            type_value = (properties.get(PROP_TYPE, {}).get("select") or {}).get("name")
+            if type_value == TYPE_EXCLUDE:
+                return False
+
+        return True
 
     def _parse_page(self, page: dict) -> Optional[NotionTask]:
         """Parse a Notion page into a NotionTask."""
@@ -329,7 +582,7 @@ class NotionClient:
                 date_str = date_obj["start"]
                 # Handle both date and datetime formats
                 if "T" in date_str:
-                    due_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                    due_date = parse_iso_datetime(date_str)
                 else:
                     due_date = datetime.strptime(date_str, "%Y-%m-%d").replace(
                         tzinfo=timezone.utc
@@ -343,18 +596,15 @@ class NotionClient:
             last_updated_str = properties.get("Last updated", {}).get(
                 "last_edited_time", page.get("last_edited_time")
             )
-            last_updated = datetime.fromisoformat(
-                last_updated_str.replace("Z", "+00:00")
-            )
+            last_updated = parse_iso_datetime(last_updated_str)
 
-            # Customer (relation)
-            customer_name = None
+            # Customer (relation). Names not already cached are looked up
+            # for all tasks at once by _resolve_customer_names.
+            customer_id = None
             customer_prop = properties.get(PROP_CUSTOMER, {})
             customer_relations = customer_prop.get("relation", [])
             if customer_relations:
                 customer_id = customer_relations[0].get("id")
-                if customer_id:
-                    customer_name = self._get_customer_name(customer_id)
 
             # Page URL
             url = page.get("url", f"https://notion.so/{page_id}")
@@ -365,13 +615,32 @@ class NotionClient:
                 due_date=due_date,
                 status=status,
                 last_updated=last_updated,
-                customer_name=customer_name,
+                customer_name=None,
                 url=url,
+                customer_id=customer_id,
             )
         except Exception as e:
             print(f"Warning: Failed to parse page: {e}")
             return None
 
+    def clear_caches(self):
+        """Forget cached customer names and property IDs so they are fetched again."""
+        self._customer_cache.clear()
+        self._schema_cache.clear()
+
+    def _resolve_customer_names(self, tasks: list[NotionTask]):
+        """Fill in customer names, fetching uncached customers concurrently."""
+        missing = {
+            t.customer_id for t in tasks
+            if t.customer_id and t.customer_id not in self._customer_cache
+        }
+        if missing:
+            list(self._executor.map(self._get_customer_name, missing))
+
+        for task in tasks:
+            if task.customer_id:
+                task.customer_name = self._customer_cache.get(task.customer_id)
+
     def _get_customer_name(self, customer_page_id: str) -> Optional[str]:
         """Fetch customer name from related page."""
         if customer_page_id in self._customer_cache:
@@ -379,9 +648,9 @@ class NotionClient:
 
         try:
             url = f"{self.BASE_URL}/pages/{customer_page_id}"
-            response = self.session.get(url)
+            response = self._request("GET", url)
             response.raise_for_status()
-            page = response.json()
+            page = json_loads(response.content)
 
             # Try to find the title property
             for prop_name, prop_value in page.get("properties", {}).items():
@@ -396,10 +665,8 @@ class NotionClient:
 
         return None
 
-    def update_task_due_date(self, page_id: str, due_date: Optional[datetime]) -> bool:
-        """Update the due date of a Notion task."""
-        url = f"{self.BASE_URL}/pages/{page_id}"
-
+    def update_task_due_date(self, page_id: str, due_date: Optional[datetime]):
+        """Queue an update of the due date of a Notion task."""
         if due_date:
             # Format as date only (no time component)
             date_str = due_date.strftime("%Y-%m-%d")
@@ -407,133 +674,157 @@ class NotionClient:
         else:
             date_value = None
 
-        payload = {
-            "properties": {
-                PROP_DUE_DATE: {
-                    "date": date_value
-                }
+        self._queue_update(page_id, {
+            PROP_DUE_DATE: {
+                "date": date_value
             }
-        }
+        })
 
-        try:
-            response = self.session.patch(url, json=payload)
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            print(f"Error updating due date for {page_id}: {e}")
-            return False
+    def update_task_title(self, page_id: str, title: str):
+        """Queue an update of the title of a Notion task."""
+        self._queue_update(page_id, {
+            PROP_TITLE: {
+                "title": [
+                    {
+                        "type": "text",
+                        "text": {"content": title}
+                    }
+                ]
+            }
+        })
 
-    def update_task_title(self, page_id: str, title: str) -> bool:
-        """Update the title of a Notion task."""
-        url = f"{self.BASE_URL}/pages/{page_id}"
+    def mark_task_done(self, page_id: str):
+        """Queue marking a Notion task as Done."""
+        self._queue_update(page_id, {
+            PROP_STATUS: {
+                "status": {"name": STATUS_DONE}
+            }
+        })
 
-        payload = {
-            "properties": {
-                PROP_TITLE: {
-                    "title": [
-                        {
-                            "type": "text",
-                            "text": {"content": title}
-                        }
-                    ]
-                }
+    def mark_task_canceled(self, page_id: str):
+        """Queue marking a Notion task as Canceled."""
+        self._queue_update(page_id, {
+            PROP_STATUS: {
+                "status": {"name": STATUS_CANCELED}
             }
-        }
+        })
 
-        try:
-            response = self.session.patch(url, json=payload)
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            print(f"Error updating title for {page_id}: {e}")
-            return False
+    def _queue_update(self, page_id: str, properties: dict):
+        """Merge property updates into the pending PATCH for a page."""
+        self._pending_updates.setdefault(page_id, {}).update(properties)
 
-    def mark_task_done(self, page_id: str) -> bool:
-        """Mark a Notion task as Done."""
-        url = f"{self.BASE_URL}/pages/{page_id}"
+    def flush_updates(self) -> dict[str, bool]:
+        """
+        Send all queued property updates to Notion.
 
-        payload = {
-            "properties": {
-                PROP_STATUS: {
-                    "status": {"name": STATUS_DONE}
-                }
-            }
-        }
+        Each page gets at most one PATCH, and the PATCHes are sent
+        concurrently (capped at MAX_CONCURRENT_REQUESTS). Returns a map of
+        page ID -> whether its update succeeded.
+        """
+        merged = self._pending_updates
+        self._pending_updates = {}
 
-        try:
-            response = self.session.patch(url, json=payload)
-            response.raise_for_status()
-            return True
-        except Exception as e:
-            print(f"Error marking task done for {page_id}: {e}")
-            return False
+        if not merged:
+            return {}
 
-    def mark_task_canceled(self, page_id: str) -> bool:
-        """Mark a Notion task as Canceled."""
-        url = f"{self.BASE_URL}/pages/{page_id}"
+        results = self._executor.map(self._patch_page, merged.keys(), merged.values())
+        return dict(zip(merged.keys(), results))
 
-        payload = {
-            "properties": {
-                PROP_STATUS: {
-                    "status": {"name": STATUS_CANCELED}
-                }
-            }
-        }
+    def _patch_page(self, page_id: str, properties: dict) -> bool:
+        """Update properties of a Notion page."""
+        url = f"{self.BASE_URL}/pages/{page_id}"
 
         try:
-            response = self.session.patch(url, json=payload)
+            response = self._request("PATCH", url, json={"properties": properties})
             response.raise_for_status()
             return True
         except Exception as e:
-            print(f"Error marking task canceled for {page_id}: {e}")
+            print(f"Error updating task {page_id}: {e}")
             return False
 
+    def get_task_statuses(self, page_ids: list[str]) -> dict[str, Optional[str]]:
+        """Get the statuses of several Notion tasks concurrently."""
+        return self._fetch_concurrently(self.get_task_status, page_ids)
+
+    def get_tasks_assignee_ids(self, page_ids: list[str]) -> dict[str, Optional[list[str]]]:
+        """Get the assignees of several Notion tasks concurrently."""
+        return self._fetch_concurrently(self.get_task_assignee_ids, page_ids)
+
+    def _fetch_concurrently(self, fetch, page_ids: list[str]) -> dict:
+        """
+        Call a per-page fetch method for each page ID, returning ID -> result.
+
+        Pages whose fetch failed are left out of the result.
+        """
+        futures = {page_id: self._executor.submit(fetch, page_id) for page_id in page_ids}
+        results = {}
+        for page_id, future in futures.items():
+            try:
+                results[page_id] = future.result()
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"Warning: Failed to fetch task {page_id}, skipping it this run: {e}")
+        return results
+
     def get_task_status(self, page_id: str) -> Optional[str]:
-        """Get the current status of a Notion task. Returns None if task doesn't exist."""
-        url = f"{self.BASE_URL}/pages/{page_id}"
+        """
+        Get the current status of a Notion task. Returns None if task doesn't exist.
 
-        try:
-            response = self.session.get(url)
-            if response.status_code == 404:
-                return None  # Task was deleted
-            response.raise_for_status()
-            page = response.json()
+        Any other failure raises (httpx.HTTPError, or ValueError for a bad
+        response body), since it says nothing about whether the task exists.
+        """
+        url = f"{self.BASE_URL}/pages/{page_id}"
 
-            # Check if archived (deleted)
-            if page.get("archived", False):
-                return None
+        response = self._request("GET", url)
+        if response.status_code == 404:
+            return None  # Task was deleted
+        response.raise_for_status()
+        page = json_loads(response.content)
 
-            status_prop = page.get("properties", {}).get(PROP_STATUS, {})
-            return status_prop.get("status", {}).get("name")
-        except Exception as e:
-            print(f"Error getting task status for {page_id}: {e}")
+        # Check if archived (deleted)
+        if page.get("archived", False):
             return None
 
+        status_prop = page.get("properties", {}).get(PROP_STATUS, {})
+        return status_prop.get("status", {}).get("name")
+
     def get_task_assignee_ids(self, page_id: str) -> Optional[list[str]]:
         """Get the current assignee user IDs of a Notion task.
 
         Returns a list of user ID strings (hyphens removed), or None if the
-        task doesn't exist or is archived.
+        task doesn't exist or is archived. Raises like get_task_status on any
+        other failure.
         """
         url = f"{self.BASE_URL}/pages/{page_id}"
 
-        try:
-            response = self.session.get(url)
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            page = response.json()
-
-            if page.get("archived", False):
-                return None
+        response = self._request("GET", url)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        page = json_loads(response.content)
 
-            assignee_prop = page.get("properties", {}).get(PROP_ASSIGNEE, {})
-            people = assignee_prop.get("people", [])
-            return [person["id"].replace("-", "") for person in people]
-        except Exception as e:
-            print(f"Error getting task assignees for {page_id}: {e}")
+        if page.get("archived", False):
             return None
 
+        assignee_prop = page.get("properties", {}).get(PROP_ASSIGNEE, {})
+        people = assignee_prop.get("people", [])
+        return [person["id"].replace("-", "") for person in people]
+
+    def create_tasks(
+        self,
+        database_id: str,
+        user_id: str,
+        items: list[tuple[str, Optional[datetime]]],
+    ) -> list[Optional[str]]:
+        """
+        Create several tasks in Notion concurrently from (title, due_date) pairs.
+
+        Returns the page IDs in input order, None where creation failed.
+        """
+        return list(self._executor.map(
+            lambda item: self.create_task(database_id, item[0], user_id, item[1]),
+            items,
+        ))
+
     def create_task(
         self,
         database_id: str,
@@ -572,45 +863,55 @@ class NotionClient:
         }
 
         try:
-            response = self.session.post(url, json=payload)
+            response = self._request("POST", url, json=payload)
             response.raise_for_status()
-            page = response.json()
+            page = json_loads(response.content)
             return page["id"].replace("-", "")
         except Exception as e:
             print(f"Error creating task: {e}")
             return None
 
 
+def wait_for_semaphore(semaphore, timeout: float) -> bool:
+    """Block until a dispatch semaphore is signaled. Returns False on timeout."""
+    deadline = libdispatch.dispatch_time(
+        libdispatch.DISPATCH_TIME_NOW, int(timeout * 1_000_000_000)
+    )
+    return libdispatch.dispatch_semaphore_wait(semaphore, deadline) == 0
+
+
 class RemindersClient:
     """Client for Apple Reminders via EventKit."""
 
+    # Seconds to wait for EventKit completion handlers
+    CALLBACK_TIMEOUT = 30
+
     def __init__(self):
         self.store = EventKit.EKEventStore.alloc().init()
         self._authorized = False
         self._work_list = None
+        # Looked up once rather than per parsed reminder
+        self._calendar = Foundation.NSCalendar.currentCalendar()
+        self._supports_hashtags = bool(
+            EventKit.EKReminder.instancesRespondToSelector_(b"hashtagTexts")
+        )
 
     def request_access(self) -> bool:
         """Request access to Reminders. Blocks until permission is granted or denied."""
-        # Use a flag to track authorization result
-        result = {"granted": False, "done": False}
+        result = {"granted": False}
+        # EventKit calls the handler on a background queue, so the calling
+        # thread can block on a semaphore instead of pumping its run loop
+        semaphore = libdispatch.dispatch_semaphore_create(0)
 
         def completion_handler(granted, error):
             result["granted"] = granted
             if error:
                 print(f"Authorization error: {error}")
-            result["done"] = True
+            libdispatch.dispatch_semaphore_signal(semaphore)
 
         # Request full access (required for writing)
         self.store.requestFullAccessToRemindersWithCompletion_(completion_handler)
-
-        # Wait for completion (with timeout)
-        timeout = 30
-        start = time.time()
-        while not result["done"] and (time.time() - start) < timeout:
-            # Process events to allow callback to execute
-            Foundation.NSRunLoop.currentRunLoop().runUntilDate_(
-                Foundation.NSDate.dateWithTimeIntervalSinceNow_(0.1)
-            )
+        wait_for_semaphore(semaphore, self.CALLBACK_TIMEOUT)
 
         self._authorized = result["granted"]
         if not self._authorized:
@@ -648,40 +949,55 @@ class RemindersClient:
 
         return self._work_list
 
-    def get_all_reminders(self) -> list[Reminder]:
-        """Fetch all reminders from the Work list."""
+    def get_all_reminders(self, completed_since: Optional[datetime] = None) -> list[Reminder]:
+        """
+        Fetch all reminders from the Work list.
+
+        If completed_since is given, completed reminders are only fetched if
+        they were completed at or after that time.
+        """
         work_list = self.get_work_list()
         if not work_list:
             return []
 
-        # Create predicate for all reminders in Work list
-        predicate = self.store.predicateForRemindersInCalendars_([work_list])
+        store = self.store
+        if completed_since is None:
+            # Create predicate for all reminders in Work list
+            predicates = [store.predicateForRemindersInCalendars_([work_list])]
+        else:
+            start = Foundation.NSDate.dateWithTimeIntervalSince1970_(
+                completed_since.timestamp()
+            )
+            predicates = [
+                store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
+                    None, None, [work_list]
+                ),
+                store.predicateForCompletedRemindersWithCompletionDateStarting_ending_calendars_(
+                    start, None, [work_list]
+                ),
+            ]
+
+        return [
+            self._parse_reminder(r)
+            for predicate in predicates
+            for r in self._fetch_reminders(predicate)
+        ]
 
-        # Fetch reminders synchronously
-        reminders_result = {"reminders": None, "done": False}
+    def _fetch_reminders(self, predicate) -> list:
+        """Fetch EKReminders matching a predicate, blocking until EventKit returns them."""
+        reminders_result = {"reminders": None}
+        semaphore = libdispatch.dispatch_semaphore_create(0)
 
         def fetch_completion(reminders):
             reminders_result["reminders"] = reminders
-            reminders_result["done"] = True
+            libdispatch.dispatch_semaphore_signal(semaphore)
 
         self.store.fetchRemindersMatchingPredicate_completion_(
             predicate, fetch_completion
         )
+        wait_for_semaphore(semaphore, self.CALLBACK_TIMEOUT)
 
-        # Wait for completion
-        timeout = 30
-        start = time.time()
-        while not reminders_result["done"] and (time.time() - start) < timeout:
-            Foundation.NSRunLoop.currentRunLoop().runUntilDate_(
-                Foundation.NSDate.dateWithTimeIntervalSinceNow_(0.1)
-            )
-
-        if reminders_result["reminders"] is None:
-            return []
-
-        return [
-            self._parse_reminder(r) for r in reminders_result["reminders"]
-        ]
+        return reminders_result["reminders"] or []
 
     def _parse_reminder(self, ek_reminder) -> Reminder:
         """Parse an EKReminder into our Reminder dataclass."""
@@ -689,18 +1005,20 @@ class RemindersClient:
         due_date = None
         due_components = ek_reminder.dueDateComponents()
         if due_components:
-            calendar = Foundation.NSCalendar.currentCalendar()
-            ns_date = calendar.dateFromComponents_(due_components)
+            ns_date = self._calendar.dateFromComponents_(due_components)
             if ns_date:
                 # Convert NSDate to Python datetime
                 timestamp = ns_date.timeIntervalSince1970()
                 due_date = datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
+        # Strings from the bridge are already str subclasses (objc.pyobjc_unicode),
+        # so they're used as-is rather than copied with str()
+
         # Get URL
         url = None
         ek_url = ek_reminder.URL()
         if ek_url:
-            url = str(ek_url.absoluteString())
+            url = ek_url.absoluteString()
 
         # Get last modified date
         last_modified = None
@@ -711,14 +1029,16 @@ class RemindersClient:
 
         # Get tags (hashtags in Reminders)
         tags = []
-        if hasattr(ek_reminder, 'hashtagTexts') and ek_reminder.hashtagTexts():
-            tags = [str(t) for t in ek_reminder.hashtagTexts()]
+        if self._supports_hashtags:
+            hashtags = ek_reminder.hashtagTexts()
+            if hashtags:
+                tags = list(hashtags)
 
         return Reminder(
-            id=str(ek_reminder.calendarItemIdentifier()),
-            title=str(ek_reminder.title()) if ek_reminder.title() else "",
+            id=ek_reminder.calendarItemIdentifier(),
+            title=ek_reminder.title() or "",
             due_date=due_date,
-            notes=str(ek_reminder.notes()) if ek_reminder.notes() else None,
+            notes=ek_reminder.notes() or None,
             url=url,
             completed=bool(ek_reminder.isCompleted()),
             last_modified=last_modified,
@@ -750,8 +1070,9 @@ class RemindersClient:
         if notes:
             notes_parts.append(notes)
 
-        if notes_parts:
-            reminder.setNotes_("\n\n".join(notes_parts))
+        full_notes = "\n\n".join(notes_parts) if notes_parts else None
+        if full_notes:
+            reminder.setNotes_(full_notes)
 
         # Also store URL in the EventKit URL field for programmatic matching
         # (this field doesn't display in the UI but is reliable for lookups)
@@ -765,7 +1086,18 @@ class RemindersClient:
         error = None
         success = self.store.saveReminder_commit_error_(reminder, True, error)
         if success:
-            return self._parse_reminder(reminder)
+            # Build from the values just set instead of reading them back
+            return Reminder(
+                id=reminder.calendarItemIdentifier(),
+                title=title,
+                due_date=due_date,
+                notes=full_notes,
+                url=url,
+                completed=False,
+                last_modified=datetime.now(timezone.utc),
+                tags=[],
+                ek_reminder=reminder,
+            )
         else:
             print(f"Error creating reminder: {error}")
             return None
@@ -831,6 +1163,30 @@ class RemindersClient:
             print(f"Error deleting reminder: {error}")
         return success
 
+    def commit_reminders(self, ek_reminders: list) -> int:
+        """
+        Commit reminders that were saved with commit=False in one transaction.
+
+        If the batch commit fails, each reminder is saved and committed on its
+        own instead. Returns the number of reminders committed.
+        """
+        if not ek_reminders:
+            return 0
+
+        success, error = self.store.commit_(None)
+        if success:
+            return len(ek_reminders)
+
+        print(f"Warning: Batch commit failed ({error}), saving reminders one at a time")
+        committed = 0
+        for ek_reminder in ek_reminders:
+            success, error = self.store.saveReminder_commit_error_(ek_reminder, True, None)
+            if success:
+                committed += 1
+            else:
+                print(f"Error saving reminder: {error}")
+        return committed
+
     def get_reminder_by_id(self, reminder_id: str) -> Optional[Reminder]:
         """Fetch a specific reminder by its ID. Returns None if not found."""
         # calendarItemWithIdentifier returns the item or None
@@ -843,6 +1199,11 @@ class RemindersClient:
         return self._parse_reminder(ek_reminder)
 
 
+def format_due_date(due_date: Optional[datetime]) -> str:
+    """Format a due date for display (date only)."""
+    return str(due_date.date()) if due_date else "None"
+
+
 def extract_customer_from_notes(notes: Optional[str]) -> Optional[str]:
     """Extract customer name from notes (format: 'Customer: Name')."""
     if not notes:
@@ -890,12 +1251,94 @@ def build_updated_notes(
     return '\n\n'.join(parts) if parts else ''
 
 
+def normalize_title(title: str) -> str:
+    """Normalize title for matching."""
+    # Collapse and trim whitespace
+    return ' '.join(title.split()).lower()
+
+
+def make_notion_client(sync_state: dict) -> NotionClient:
+    """Create a NotionClient whose caches are kept in the sync state."""
+    # Customer names and property IDs rarely change, so they're kept between runs
+    return NotionClient(
+        NOTION_API_KEY,
+        customer_cache=sync_state.setdefault("customer_names", {}),
+        schema_cache=sync_state.setdefault("notion_schema", {}),
+    )
+
+
+def fetch_notion_tasks(notion: NotionClient, sync_state: dict) -> list[NotionTask]:
+    """
+    Fetch my Notion tasks, using the copy cached in the sync state.
+
+    Between full scans only pages edited since the last sync are queried
+    and merged into the cached task set. The cache is only used if it was
+    built with the current database, user, and property and status names.
+    """
+    started = datetime.now(timezone.utc)
+    last_sync = sync_state.get("notion_last_sync")
+    cached = sync_state.get("notion_tasks")
+    runs_since_full_scan = sync_state.get("notion_runs_since_full_scan", 0) + 1
+    query_key = [
+        NOTION_DATABASE_ID, NOTION_USER_ID, TYPE_EXCLUDE,
+        PROP_TITLE, PROP_ASSIGNEE, PROP_STATUS, PROP_DUE_DATE, PROP_CUSTOMER, PROP_TYPE,
+        STATUS_DONE, STATUS_CANCELED,
+    ]
+
+    full_scan = (
+        last_sync is None
+        or cached is None
+        or sync_state.get("notion_query_key") != query_key
+        or runs_since_full_scan >= NOTION_FULL_SCAN_INTERVAL
+    )
+    if full_scan:
+        # Also pick up renamed customers and schema changes
+        notion.clear_caches()
+        notion_tasks = notion.query_my_tasks(NOTION_DATABASE_ID, NOTION_USER_ID)
+        runs_since_full_scan = 0
+    else:
+        # last_edited_time is rounded down to the minute, so look back a bit
+        edited_since = datetime.fromisoformat(last_sync) - timedelta(minutes=1)
+        changed, dropped_ids = notion.query_changed_tasks(
+            NOTION_DATABASE_ID, NOTION_USER_ID, edited_since
+        )
+        print(f"  {len(changed) + len(dropped_ids)} pages changed since last sync")
+
+        tasks_by_id = {
+            page_id: NotionTask.from_dict(data) for page_id, data in cached.items()
+        }
+        for page_id in dropped_ids:
+            tasks_by_id.pop(page_id, None)
+        for task in changed:
+            tasks_by_id[task.page_id] = task
+        notion_tasks = list(tasks_by_id.values())
+
+    sync_state["notion_tasks"] = {t.page_id: t.to_dict() for t in notion_tasks}
+    sync_state["notion_query_key"] = query_key
+    sync_state["notion_last_sync"] = started.isoformat()
+    sync_state["notion_runs_since_full_scan"] = runs_since_full_scan
+    return notion_tasks
+
+
 class NotionRemindersSync:
     """Bidirectional sync between Notion and Apple Reminders."""
 
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
-        self.notion = NotionClient(NOTION_API_KEY)
+
+        # Load previous sync state for deletion detection
+        self.sync_state = load_sync_state()
+        # Notion statuses known during a run (page_id -> status, None if deleted)
+        self._status_cache: dict[str, Optional[str]] = {}
+        # Pairs found in sync during a run
+        # (page_id -> (reminder ns, Notion ns, customer name))
+        self._in_sync: dict[str, tuple[int, int, Optional[str]]] = {}
+        # Notion counters waiting on the queued PATCH of a page (page_id -> stats)
+        self._pending_notion_stats: dict[str, list[str]] = {}
+        # Pages whose PATCH failed during a run; their pairs are kept for a retry
+        self._failed_notion_updates: set[str] = set()
+
+        self.notion = make_notion_client(self.sync_state)
         self.reminders = RemindersClient()
 
         # Stats
@@ -911,9 +1354,6 @@ class NotionRemindersSync:
             "notion_tasks_canceled": 0,
         }
 
-        # Load previous sync state for deletion detection
-        self.sync_state = load_sync_state()
-
     def run(self):
         """Run the full sync process."""
         print("=" * 60)
@@ -923,34 +1363,39 @@ class NotionRemindersSync:
         if self.dry_run:
             print("** DRY RUN MODE - No changes will be made **\n")
 
+        self._in_sync = {}
+        self._pending_notion_stats = {}
+        self._failed_notion_updates = set()
+
         # Request Reminders access
         print("Requesting Reminders access...")
         if not self.reminders.request_access():
             print("Cannot proceed without Reminders access.")
             return
 
-        # Fetch data from both sources
-        print("\nFetching Notion tasks...")
-        notion_tasks = self.notion.query_my_tasks(NOTION_DATABASE_ID, NOTION_USER_ID)
+        # Fetch data from both sources at once: Notion on a worker thread,
+        # Reminders on this one (EventKit objects stay on the main thread)
+        print("\nFetching Notion tasks and Reminders...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            notion_future = executor.submit(fetch_notion_tasks, self.notion, self.sync_state)
+            all_reminders = self._fetch_reminders()
+            notion_tasks = notion_future.result()
         print(f"  Found {len(notion_tasks)} tasks")
-
-        print("\nFetching Reminders...")
-        all_reminders = self.reminders.get_all_reminders()
         print(f"  Found {len(all_reminders)} reminders in '{REMINDERS_LIST_NAME}' list")
 
         # Build lookup maps
         notion_by_id = {t.page_id: t for t in notion_tasks}
+        # Tasks in the filtered set exist and are open, so their statuses
+        # never need a lookup
+        self._status_cache = {t.page_id: t.status for t in notion_tasks}
         reminders_by_id = {r.id: r for r in all_reminders}
-        reminders_by_notion_id: dict[str, Reminder] = {}
-        unlinked_notion_reminders: list[Reminder] = []
-
-        for r in all_reminders:
-            notion_id = r.notion_page_id
-            if notion_id:
-                reminders_by_notion_id[notion_id] = r
-            elif not r.url and not r.completed:
-                # New reminder in sync list but not yet linked to Notion
-                unlinked_notion_reminders.append(r)
+        reminders_by_notion_id: dict[str, Reminder] = {
+            notion_id: r for r in all_reminders if (notion_id := r.notion_page_id)
+        }
+        # New reminders in sync list but not yet linked to Notion
+        unlinked_notion_reminders: list[Reminder] = [
+            r for r in all_reminders if not r.url and not r.completed
+        ]
 
         # Sync operations
         print("\n" + "-" * 40)
@@ -970,11 +1415,15 @@ class NotionRemindersSync:
         self._sync_existing_pairs(notion_by_id, reminders_by_notion_id)
 
         # 5. Handle completed reminders -> mark Notion done
-        self._handle_completed_reminders(notion_by_id, all_reminders)
+        # (reminders_by_id also holds completed reminders found by _handle_deletions)
+        self._handle_completed_reminders(notion_by_id, list(reminders_by_id.values()))
 
         # 6. Create Notion tasks from new tagged reminders
         self._create_notion_from_reminders(unlinked_notion_reminders)
 
+        # Send the queued Notion updates, one PATCH per page
+        self._flush_notion_updates()
+
         # 7. Update and save sync state
         self._update_sync_state(reminders_by_notion_id)
 
@@ -992,6 +1441,24 @@ class NotionRemindersSync:
         print(f"  Notion tasks completed: {self.stats['notion_tasks_completed']}")
         print(f"  Notion tasks canceled:  {self.stats['notion_tasks_canceled']}")
 
+    def _fetch_reminders(self) -> list[Reminder]:
+        """
+        Fetch reminders in the sync list.
+
+        Completed reminders are only needed until their Notion task has been
+        marked Done, so after the first sync only those completed since the
+        previous sync (with a day of slack for failed updates) are fetched.
+        """
+        started = datetime.now(timezone.utc)
+        last_sync = self.sync_state.get("reminders_last_sync")
+        completed_since = None
+        if last_sync:
+            completed_since = datetime.fromisoformat(last_sync) - timedelta(days=1)
+
+        all_reminders = self.reminders.get_all_reminders(completed_since=completed_since)
+        self.sync_state["reminders_last_sync"] = started.isoformat()
+        return all_reminders
+
     def _handle_deletions(
         self,
         notion_by_id: dict[str, NotionTask],
@@ -1006,7 +1473,30 @@ class NotionRemindersSync:
         """
         previous_pairs = self.sync_state.get("synced_pairs", {})
 
-        for notion_id, reminder_id in list(previous_pairs.items()):
+        # Tasks missing from our filtered set may have been deleted, or just
+        # filtered out. Tasks already known to be Done or Canceled were filtered
+        # out; query Notion for the rest up front, concurrently.
+        missing_ids = [nid for nid in previous_pairs if nid not in notion_by_id]
+        known_statuses = self.sync_state.get("known_statuses", {})
+        closed = {
+            nid: known_statuses[nid] for nid in missing_ids
+            if known_statuses.get(nid) in (STATUS_DONE, STATUS_CANCELED)
+        }
+        self._status_cache.update(closed)
+        statuses = self._get_task_statuses(missing_ids)
+        # If a task still exists and has a reminder, check if it was reassigned away
+        assignees = self.notion.get_tasks_assignee_ids([
+            nid for nid in missing_ids
+            if statuses.get(nid) is not None and nid not in closed
+            and pair_reminder_id(previous_pairs[nid]) in reminders_by_id
+        ])
+
+        user_id = NOTION_USER_ID.replace("-", "")
+        # Pairs that are gone; removed after the loop
+        removed: set[str] = set()
+
+        for notion_id, pair in previous_pairs.items():
+            reminder_id = pair_reminder_id(pair)
             reminder_exists = reminder_id in reminders_by_id
             notion_exists = notion_id in notion_by_id
 
@@ -1014,29 +1504,32 @@ class NotionRemindersSync:
             notion_deleted = False
             reassigned = False
             if not notion_exists:
-                # Query Notion directly to see if it's deleted vs just Done/Canceled
-                status = self.notion.get_task_status(notion_id)
-                notion_deleted = (status is None)  # None means deleted/archived
+                if notion_id not in statuses:
+                    continue  # Status lookup failed; check again next run
+                notion_deleted = (statuses[notion_id] is None)  # None means deleted/archived
 
-                # If the task still exists, check if it was reassigned away
-                if not notion_deleted and reminder_exists:
-                    assignee_ids = self.notion.get_task_assignee_ids(notion_id)
-                    if assignee_ids is not None:
-                        user_id = NOTION_USER_ID.replace("-", "")
-                        reassigned = user_id not in assignee_ids
+                assignee_ids = assignees.get(notion_id)
+                if assignee_ids is not None:
+                    reassigned = user_id not in assignee_ids
 
             if not reminder_exists and notion_exists:
+                # Reminders completed before the fetch window (e.g. synced late
+                # from another device) weren't fetched; don't take them for deleted
+                reminder = self._find_completed_reminder(reminder_id)
+                if reminder:
+                    # Marked Done with the other completed reminders
+                    reminders_by_id[reminder_id] = reminder
+                    reminders_by_notion_id[notion_id] = reminder
+                    continue
+
                 # Reminder was deleted -> cancel Notion task
                 task = notion_by_id[notion_id]
                 print(f"\n  Canceling Notion task (reminder deleted): {task.title}")
 
+                # The pair is dropped from state once the cancel has been sent
                 if not self.dry_run:
-                    if self.notion.mark_task_canceled(notion_id):
-                        self.stats["notion_tasks_canceled"] += 1
-                        # Remove from state since it's now canceled
-                        del previous_pairs[notion_id]
-                else:
-                    self.stats["notion_tasks_canceled"] += 1
+                    self.notion.mark_task_canceled(notion_id)
+                self._count_notion_update(notion_id, "notion_tasks_canceled")
 
             elif reminder_exists and notion_deleted:
                 # Notion task was deleted -> delete the reminder
@@ -1046,11 +1539,7 @@ class NotionRemindersSync:
                 if not self.dry_run:
                     if self.reminders.delete_reminder(reminder):
                         self.stats["reminders_deleted"] += 1
-                        # Remove from state
-                        del previous_pairs[notion_id]
-                        # Remove from lookup maps
-                        if notion_id in reminders_by_notion_id:
-                            del reminders_by_notion_id[notion_id]
+                        removed.add(notion_id)
                 else:
                     self.stats["reminders_deleted"] += 1
 
@@ -1062,14 +1551,28 @@ class NotionRemindersSync:
                 if not self.dry_run:
                     if self.reminders.delete_reminder(reminder):
                         self.stats["reminders_reassigned"] += 1
-                        # Remove from state
-                        del previous_pairs[notion_id]
-                        # Remove from lookup maps
-                        if notion_id in reminders_by_notion_id:
-                            del reminders_by_notion_id[notion_id]
+                        removed.add(notion_id)
                 else:
                     self.stats["reminders_reassigned"] += 1
 
+        # Remove from state and lookup maps
+        for notion_id in removed:
+            previous_pairs.pop(notion_id, None)
+            reminders_by_notion_id.pop(notion_id, None)
+
+    def _find_completed_reminder(self, reminder_id: str) -> Optional[Reminder]:
+        """Look up a paired reminder missing from the fetch, if completed in the sync list."""
+        reminder = self.reminders.get_reminder_by_id(reminder_id)
+        if not reminder or not reminder.completed:
+            return None
+        work_list = self.reminders.get_work_list()
+        calendar = reminder.ek_reminder.calendar()
+        if not work_list or not calendar:
+            return None
+        if calendar.calendarIdentifier() != work_list.calendarIdentifier():
+            return None  # Moved to another list, which counts as deleted
+        return reminder
+
     def _handle_notion_status_changes(
         self,
         reminders_by_notion_id: dict[str, Reminder],
@@ -1082,16 +1585,17 @@ class NotionRemindersSync:
         """
         previous_pairs = self.sync_state.get("synced_pairs", {})
 
-        for notion_id, reminder_id in list(previous_pairs.items()):
-            if notion_id not in reminders_by_notion_id:
-                continue
+        # Check current Notion status of every pair with an open reminder at once
+        statuses = self._get_task_statuses([
+            nid for nid in previous_pairs
+            if nid in reminders_by_notion_id and not reminders_by_notion_id[nid].completed
+        ])
 
-            reminder = reminders_by_notion_id[notion_id]
-            if reminder.completed:
-                continue  # Already completed
+        # Pairs whose reminder was deleted; removed after the loop
+        removed: set[str] = set()
 
-            # Check current Notion status
-            status = self.notion.get_task_status(notion_id)
+        for notion_id, status in statuses.items():
+            reminder = reminders_by_notion_id[notion_id]
 
             if status == STATUS_DONE:
                 print(f"\n  Completing reminder (Notion marked Done): {reminder.title}")
@@ -1108,24 +1612,86 @@ class NotionRemindersSync:
                 if not self.dry_run:
                     if self.reminders.delete_reminder(reminder):
                         self.stats["reminders_deleted"] += 1
-                        # Remove from state and lookup
-                        del previous_pairs[notion_id]
-                        del reminders_by_notion_id[notion_id]
+                        removed.add(notion_id)
                 else:
                     self.stats["reminders_deleted"] += 1
 
+        # Remove from state and lookup
+        for notion_id in removed:
+            del previous_pairs[notion_id]
+            del reminders_by_notion_id[notion_id]
+
+    def _get_task_statuses(self, page_ids: list[str]) -> dict[str, Optional[str]]:
+        """
+        Get Notion task statuses, fetching each page at most once per run.
+
+        Pages whose status couldn't be fetched are left out.
+        """
+        uncached = [pid for pid in page_ids if pid not in self._status_cache]
+        self._status_cache.update(self.notion.get_task_statuses(uncached))
+        return {
+            pid: self._status_cache[pid] for pid in page_ids if pid in self._status_cache
+        }
+
+    def _count_notion_update(self, page_id: str, stat: str):
+        """Count a queued Notion update once it has been sent successfully."""
+        if self.dry_run:
+            self.stats[stat] += 1
+        else:
+            self._pending_notion_stats.setdefault(page_id, []).append(stat)
+
+    def _flush_notion_updates(self):
+        """Send the queued Notion updates, counting the ones that succeeded."""
+        for page_id, succeeded in self.notion.flush_updates().items():
+            if succeeded:
+                for stat in self._pending_notion_stats.get(page_id, []):
+                    self.stats[stat] += 1
+            else:
+                self._failed_notion_updates.add(page_id)
+        self._pending_notion_stats = {}
+
     def _update_sync_state(self, reminders_by_notion_id: dict[str, Reminder]):
         """Update and save the sync state with current pairs."""
         if self.dry_run:
             return
 
-        # Build new state from current synced pairs
-        new_pairs = {}
+        pairs = self.sync_state.setdefault("synced_pairs", {})
+
+        # Only track active pairs, but keep those whose Notion update failed
+        # so the next run retries it
+        stale = [
+            notion_id for notion_id in pairs
+            if notion_id not in self._failed_notion_updates
+            and (
+                notion_id not in reminders_by_notion_id
+                or reminders_by_notion_id[notion_id].completed
+            )
+        ]
+        for notion_id in stale:
+            del pairs[notion_id]
+
+        # Update the remaining pairs in place, remembering when each was last
+        # seen in sync
         for notion_id, reminder in reminders_by_notion_id.items():
-            if not reminder.completed:  # Only track active pairs
-                new_pairs[notion_id] = reminder.id
+            if reminder.completed:
+                continue
+            pair = pairs.get(notion_id)
+            if not isinstance(pair, dict):
+                pair = pairs[notion_id] = {}
+            pair["reminder_id"] = reminder.id
+            pair["r_mtime_ns"], pair["n_mtime_ns"], pair["customer_name"] = (
+                self._in_sync.get(notion_id, (None, None, None))
+            )
+
+        # Remember the Notion status of each tracked pair, so later runs can
+        # tell a closed task from a deleted one without asking Notion
+        known_statuses = self.sync_state.get("known_statuses", {})
+        self.sync_state["known_statuses"] = {
+            notion_id: status for notion_id in pairs
+            if (status := self._status_cache.get(notion_id, known_statuses.get(notion_id)))
+            is not None
+        }
 
-        self.sync_state["synced_pairs"] = new_pairs
         save_sync_state(self.sync_state)
 
     def _create_missing_reminders(
@@ -1171,7 +1737,13 @@ class NotionRemindersSync:
         - Reminders is primary: always push Reminders changes to Notion
         - Notion only updates Reminders if Notion is newer
         - Customer always syncs from Notion -> Reminders (one-way)
+
+        Pairs where neither side was modified since they were last found in
+        sync are skipped. The customer name is checked too: renaming a
+        customer doesn't touch the task pages that link to it.
         """
+        previous_pairs = self.sync_state.get("synced_pairs", {})
+
         for notion_id, reminder in reminders_by_notion_id.items():
             if reminder.completed:
                 continue  # Handle completed separately
@@ -1180,16 +1752,26 @@ class NotionRemindersSync:
             if not notion_task:
                 continue  # Task no longer in our filtered set
 
-            notion_modified = notion_task.last_updated
-            reminder_modified = reminder.last_modified
+            notion_modified = notion_task.last_updated_ns
+            reminder_modified = reminder.last_modified_ns
+
+            in_sync = (reminder_modified, notion_modified, notion_task.customer_name)
+            if reminder_modified is not None:
+                pair = previous_pairs.get(notion_id)
+                if (
+                    isinstance(pair, dict)
+                    and pair.get("r_mtime_ns") == reminder_modified
+                    and pair.get("n_mtime_ns") == notion_modified
+                    and pair.get("customer_name") == notion_task.customer_name
+                ):
+                    self._in_sync[notion_id] = in_sync
+                    continue
 
             # Compare titles directly (no tag stripping needed)
             title_changed = reminder.title != notion_task.title
 
-            # Compare due dates (normalize to date only for comparison)
-            notion_due = notion_task.due_date.date() if notion_task.due_date else None
-            reminder_due = reminder.due_date.date() if reminder.due_date else None
-            due_changed = notion_due != reminder_due
+            # Compare due dates (normalized to date only)
+            due_changed = notion_task.due_ordinal != reminder.due_ordinal
 
             # Compare customer (always sync from Notion -> Reminders)
             current_customer = extract_customer_from_notes(reminder.notes)
@@ -1197,6 +1779,8 @@ class NotionRemindersSync:
             customer_changed = current_customer != notion_customer
 
             if not title_changed and not due_changed and not customer_changed:
+                if reminder_modified is not None:
+                    self._in_sync[notion_id] = in_sync
                 continue  # No changes needed
 
             # Determine which direction to sync
@@ -1208,7 +1792,7 @@ class NotionRemindersSync:
             # If Notion is newer -> push to Reminders
 
             reminder_is_newer = True
-            if reminder_modified and notion_modified:
+            if reminder_modified is not None and notion_modified is not None:
                 reminder_is_newer = reminder_modified >= notion_modified
 
             if reminder_is_newer:
@@ -1218,16 +1802,17 @@ class NotionRemindersSync:
                     print(f"    Was: '{notion_task.title}'")
                     if not self.dry_run:
                         self.notion.update_task_title(notion_task.page_id, reminder.title)
-                    self.stats["notion_tasks_updated"] += 1
+                    self._count_notion_update(notion_task.page_id, "notion_tasks_updated")
 
                 if due_changed:
-                    print(f"\n  Updating Notion due date: {reminder_due}")
-                    print(f"    Was: {notion_due}")
+                    new_due = format_due_date(reminder.due_date)
+                    print(f"\n  Updating Notion due date: {new_due}")
+                    print(f"    Was: {format_due_date(notion_task.due_date)}")
                     if not self.dry_run:
                         self.notion.update_task_due_date(
                             notion_task.page_id, reminder.due_date
                         )
-                    self.stats["notion_tasks_updated"] += 1
+                    self._count_notion_update(notion_task.page_id, "notion_tasks_updated")
 
                 # Customer always syncs from Notion -> Reminders even if Reminders is newer
                 if customer_changed:
@@ -1282,46 +1867,54 @@ class NotionRemindersSync:
 
             if not self.dry_run:
                 self.notion.mark_task_done(notion_task.page_id)
-            self.stats["notion_tasks_completed"] += 1
+            self._count_notion_update(notion_task.page_id, "notion_tasks_completed")
 
     def _create_notion_from_reminders(self, unlinked_reminders: list[Reminder]):
         """Create Notion tasks from Reminders in the sync list that have no URL."""
         for reminder in unlinked_reminders:
             print(f"\n  Creating Notion task from reminder: {reminder.title}")
 
-            if not self.dry_run:
-                page_id = self.notion.create_task(
-                    NOTION_DATABASE_ID,
-                    reminder.title,
-                    NOTION_USER_ID,
-                    reminder.due_date,
+        if self.dry_run:
+            self.stats["notion_tasks_created"] += len(unlinked_reminders)
+            return
+
+        # Create the Notion tasks concurrently; EventKit updates stay on this thread
+        page_ids = self.notion.create_tasks(
+            NOTION_DATABASE_ID,
+            NOTION_USER_ID,
+            [(reminder.title, reminder.due_date) for reminder in unlinked_reminders],
+        )
+
+        pending = []
+        for reminder, page_id in zip(unlinked_reminders, page_ids):
+            if page_id:
+                # Update reminder with the Notion URL in both places
+                notion_url = f"https://notion.so/{page_id}"
+                ek_reminder = reminder.ek_reminder
+
+                # Set URL in EventKit field (for programmatic matching)
+                ns_url = Foundation.NSURL.URLWithString_(notion_url)
+                ek_reminder.setURL_(ns_url)
+
+                # Add URL to notes (for visibility/clickability in Reminders UI)
+                existing_notes = ek_reminder.notes()
+                if existing_notes:
+                    new_notes = f"{notion_url}\n\n{existing_notes}"
+                else:
+                    new_notes = notion_url
+                ek_reminder.setNotes_(new_notes)
+
+                # Committed together after the loop
+                error = None
+                self.reminders.store.saveReminder_commit_error_(
+                    ek_reminder, False, error
                 )
-                if page_id:
-                    # Update reminder with the Notion URL in both places
-                    notion_url = f"https://notion.so/{page_id}"
-                    ek_reminder = reminder.ek_reminder
-
-                    # Set URL in EventKit field (for programmatic matching)
-                    ns_url = Foundation.NSURL.URLWithString_(notion_url)
-                    ek_reminder.setURL_(ns_url)
-
-                    # Add URL to notes (for visibility/clickability in Reminders UI)
-                    existing_notes = ek_reminder.notes()
-                    if existing_notes:
-                        new_notes = f"{notion_url}\n\n{existing_notes}"
-                    else:
-                        new_notes = notion_url
-                    ek_reminder.setNotes_(new_notes)
-
-                    error = None
-                    self.reminders.store.saveReminder_commit_error_(
-                        ek_reminder, True, error
-                    )
+                pending.append(ek_reminder)
 
-                    self.stats["notion_tasks_created"] += 1
-            else:
                 self.stats["notion_tasks_created"] += 1
 
+        self.reminders.commit_reminders(pending)
+
 
 def cmd_sync(args):
     """Run the sync process."""
@@ -1343,14 +1936,17 @@ def cmd_fix_urls(args):
     if args.dry_run:
         print("** DRY RUN MODE - No changes will be made **\n")
 
-    # Initialize clients
-    notion = NotionClient(CONFIG["NOTION_API_KEY"])
+    # Initialize clients, sharing the sync's cached Notion tasks
+    sync_state = load_sync_state()
+    notion = make_notion_client(sync_state)
     reminders_client = RemindersClient()
 
     # Get all Notion tasks
     print("Fetching Notion tasks...")
-    notion_tasks = notion.query_my_tasks(NOTION_DATABASE_ID, NOTION_USER_ID)
+    notion_tasks = fetch_notion_tasks(notion, sync_state)
     print(f"  Found {len(notion_tasks)} tasks assigned to you\n")
+    if not args.dry_run:
+        save_sync_state(sync_state)
 
     # Get all reminders without URLs
     print(f"Fetching reminders from '{REMINDERS_LIST_NAME}' without URLs...")
@@ -1363,12 +1959,6 @@ def cmd_fix_urls(args):
         return
 
     # Build a lookup by normalized title
-    def normalize_title(title: str) -> str:
-        """Normalize title for matching."""
-        # Remove extra whitespace
-        title = ' '.join(title.split())
-        return title.strip().lower()
-
     notion_by_title = {}
     for task in notion_tasks:
         normalized = normalize_title(task.title)
@@ -1377,6 +1967,7 @@ def cmd_fix_urls(args):
     # Match and fix
     fixed_count = 0
     not_found = []
+    pending = []
 
     print("Matching reminders to Notion tasks...")
     print("-" * 60)
@@ -1406,19 +1997,22 @@ def cmd_fix_urls(args):
                 else:
                     ek_reminder.setNotes_(task.url)
 
+                # Committed together after the loop
                 error = None
-                success = reminders_client.store.saveReminder_commit_error_(
-                    ek_reminder, True, error
+                reminders_client.store.saveReminder_commit_error_(
+                    ek_reminder, False, error
                 )
-                if success:
-                    fixed_count += 1
-                else:
-                    print(f"    ERROR: Failed to save reminder")
+                pending.append(ek_reminder)
             else:
                 fixed_count += 1
         else:
             not_found.append(reminder.title)
 
+    if pending:
+        fixed_count = reminders_client.commit_reminders(pending)
+        if fixed_count < len(pending):
+            print(f"\n  ERROR: Failed to save {len(pending) - fixed_count} reminders")
+
     print("\n" + "=" * 60)
     print("Summary")
     print("=" * 60)
@@ -1444,17 +2038,13 @@ def cmd_whoami(args):
         print("Error: NOTION_API_KEY not configured")
         sys.exit(1)
 
-    session = requests.Session()
-    session.headers.update({
-        "Authorization": f"Bearer {api_key}",
-        "Notion-Version": "2022-06-28",
-    })
+    session = NotionClient(api_key).session
 
     # Get bot user info
     try:
-        response = session.get("https://api.notion.com/v1/users/me")
+        response = session.get(f"{NotionClient.BASE_URL}/users/me")
         response.raise_for_status()
-        bot = response.json()
+        bot = json_loads(response.content)
         print("Bot/Integration Info:")
         print(f"  Name: {bot.get('name', 'Unknown')}")
         print(f"  ID:   {bot.get('id', 'Unknown')}")
@@ -1466,9 +2056,9 @@ def cmd_whoami(args):
     print("\nWorkspace Users:")
     print("-" * 60)
     try:
-        response = session.get("https://api.notion.com/v1/users?page_size=100")
+        response = session.get(f"{NotionClient.BASE_URL}/users", params={"page_size": 100})
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
 
         for user in data.get("results", []):
             user_type = user.get("type", "unknown")
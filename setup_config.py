@@ -14,7 +14,21 @@ import re
 import sys
 from pathlib import Path
 
-import requests
+import httpx
+
+# One client for every request, so the TLS connection is reused
+_HTTP = httpx.Client(
+    http2=True,
+    headers={"Notion-Version": "2022-06-28"},
+    timeout=30.0,
+)
+
+
+# A 32-character hex page ID, with or without dashes (8-4-4-4-12 format)
+_PAGE_ID_RE = re.compile(
+    r'([a-f0-9]{8}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{4}-?[a-f0-9]{12})',
+    re.IGNORECASE,
+)
 
 
 def extract_page_id(url: str) -> str | None:
@@ -24,34 +38,25 @@ def extract_page_id(url: str) -> str | None:
     # https://www.notion.so/abc123def456...
     # https://notion.so/abc123def456...
 
-    # Look for a 32-character hex string (with or without dashes)
     # The page ID is usually at the end of the URL path
-    match = re.search(r'([a-f0-9]{32})', url.replace('-', ''))
-    if match:
-        return match.group(1)
-
-    # Try with dashes (8-4-4-4-12 format)
-    match = re.search(r'([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})', url)
+    match = _PAGE_ID_RE.search(url)
     if match:
-        return match.group(1).replace('-', '')
+        return match.group(1).replace('-', '').lower()
 
     return None
 
 
 def get_page_info(api_key: str, page_id: str) -> dict | None:
     """Fetch page information from Notion API."""
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Notion-Version": "2022-06-28",
-    }
+    headers = {"Authorization": f"Bearer {api_key}"}
 
     url = f"https://api.notion.com/v1/pages/{page_id}"
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _HTTP.get(url, headers=headers)
         response.raise_for_status()
         return response.json()
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         if response.status_code == 401:
             print("\nError: Invalid API key or the integration doesn't have access to this page.")
             print("Make sure the integration is connected to the database in Notion.")
@@ -67,21 +72,42 @@ def get_page_info(api_key: str, page_id: str) -> dict | None:
 
 def get_user_info(api_key: str, user_id: str) -> dict | None:
     """Fetch user information from Notion API."""
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Notion-Version": "2022-06-28",
-    }
+    headers = {"Authorization": f"Bearer {api_key}"}
 
     url = f"https://api.notion.com/v1/users/{user_id}"
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _HTTP.get(url, headers=headers)
         response.raise_for_status()
         return response.json()
     except Exception:
         return None
 
 
+def list_users(api_key: str) -> dict[str, dict]:
+    """Fetch all workspace users from Notion API, keyed by user ID without dashes."""
+    headers = {"Authorization": f"Bearer {api_key}"}
+
+    url = "https://api.notion.com/v1/users"
+    users = {}
+    params = {"page_size": 100}
+
+    try:
+        while True:
+            response = _HTTP.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            data = response.json()
+            for user in data.get("results", []):
+                users[user.get("id", "").replace("-", "")] = user
+            if not data.get("has_more"):
+                break
+            params["start_cursor"] = data.get("next_cursor")
+    except Exception:
+        pass
+
+    return users
+
+
 def main():
     print("=" * 60)
     print("Notion-Reminders Sync Setup")
@@ -180,10 +206,19 @@ def main():
         print("Please use a task that is assigned to you.")
         sys.exit(1)
 
+    # Assignee objects normally include the name and email already. If any
+    # don't, look them all up with a single users list request.
+    users = {}
+    if any("name" not in person for person in assignees):
+        users = list_users(api_key)
+
+    def user_details(person: dict) -> dict:
+        return users.get(person.get("id", "").replace("-", "")) or person
+
     if len(assignees) > 1:
         print("\nThis task has multiple assignees:")
         for i, person in enumerate(assignees):
-            user_info = get_user_info(api_key, person.get("id", ""))
+            user_info = user_details(person)
             name = user_info.get("name", "Unknown") if user_info else person.get("id", "Unknown")
             email = ""
             if user_info and user_info.get("person"):
@@ -195,7 +230,7 @@ def main():
         try:
             idx = int(choice) - 1
             if 0 <= idx < len(assignees):
-                user_id = assignees[idx].get("id", "").replace("-", "")
+                assignee = assignees[idx]
             else:
                 print("Invalid choice.")
                 sys.exit(1)
@@ -203,10 +238,13 @@ def main():
             print("Invalid choice.")
             sys.exit(1)
     else:
-        user_id = assignees[0].get("id", "").replace("-", "")
+        assignee = assignees[0]
+    user_id = assignee.get("id", "").replace("-", "")
 
     # Get user name for confirmation
-    user_info = get_user_info(api_key, user_id)
+    user_info = user_details(assignee)
+    if "name" not in user_info:
+        user_info = get_user_info(api_key, user_id)
     user_name = user_info.get("name", "Unknown") if user_info else "Unknown"
     user_email = ""
     if user_info and user_info.get("person"):